@@ -10,14 +10,79 @@ Features:
     - Optional: Gemini API for cloud embeddings (default)
 """
 
+import atexit
+import contextlib
+import functools
 import os
 import hashlib
-import json
+import sqlite3
+import sys
 import threading
-import tempfile
+import time
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+import numpy as np
+
+# Optional: blake3 (Rust/SIMD) is 3-10x faster than stdlib hashing on short texts
+try:
+    import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+# Optional: fair reader-writer lock so concurrent get()s don't serialize
+try:
+    from readerwriterlock import rwlock as _rwlock
+except ImportError:
+    _rwlock = None
+
+
+class _SimpleRWLock:
+    """Minimal reader-writer lock (fallback when readerwriterlock is absent).
+
+    Exposes the same gen_rlock()/gen_wlock() context-manager surface as
+    readerwriterlock.RWLockFair. Writers get priority: new readers queue
+    behind a waiting writer so sustained read traffic cannot starve
+    set_many()/flush().
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextlib.contextmanager
+    def gen_rlock(self):
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextlib.contextmanager
+    def gen_wlock(self):
+        with self._cond:
+            self._waiting_writers += 1
+            try:
+                while self._writer or self._readers:
+                    self._cond.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
 # Global cache instance
 _embedding_cache = None
 _embedding_cache_lock = threading.Lock()
@@ -27,26 +92,117 @@ _chroma_client = None
 _chroma_collection = None
 _chroma_lock = threading.Lock()
 
+# Per-type collections (athena_sessions, athena_protocols, ...), lazy loaded.
+# Smaller per-collection HNSW graphs need lower search_ef for the same recall.
+_collections: Dict[str, Any] = {}
+
+# SentenceTransformer model (lazy loaded singleton)
+_st_model = None
+_st_lock = threading.Lock()
+
+# Shared HTTP session (lazy loaded, keeps TCP+TLS connections to Gemini alive)
+_session = None
+_session_lock = threading.Lock()
+
+# Gemini API key (resolved once; load_dotenv re-parses .env on every call)
+_google_api_key = None
+
+
+def _get_google_api_key() -> str:
+    """Resolve and cache GOOGLE_API_KEY, loading .env at most once."""
+    global _google_api_key
+    if _google_api_key is None:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _google_api_key = os.getenv("GOOGLE_API_KEY")
+    if not _google_api_key:
+        raise ValueError(
+            "GOOGLE_API_KEY missing. Set it in .env or use use_local=True"
+        )
+    return _google_api_key
+
+
+def _get_session():
+    """Get or create the pooled requests.Session used for Gemini API calls.
+
+    Reusing one session amortizes the TCP+TLS handshake (~100 ms) across
+    calls and retries transient 429/5xx responses with backoff.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                ),
+            )
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+# Explicit HNSW parameters: Chroma's defaults (construction_ef=100, M=16,
+# search_ef=10) under-recall once a collection grows past ~100k vectors.
+HNSW_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:construction_ef": 128,
+    "hnsw:M": 24,
+    "hnsw:search_ef": 100,
+    "hnsw:num_threads": os.cpu_count() or 4,
+    "hnsw:batch_size": 1000,
+    "hnsw:sync_threshold": 10000,
+}
+
+
+def _prefetch_chroma_files(chroma_path: Path):
+    """Hint the kernel to read Chroma's index files ahead of first query.
+
+    Cold starts otherwise pagefault random 4k reads across the HNSW
+    graph and SQLite file. posix_fadvise(WILLNEED) turns that into
+    sequential prefetch; silently a no-op on platforms without it.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    with contextlib.suppress(Exception):
+        for pattern in ("**/*.bin", "*.sqlite3"):
+            for path in chroma_path.glob(pattern):
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+
 
 def get_chroma_client():
     """Get or create ChromaDB client for local storage."""
     global _chroma_client, _chroma_collection
-    
+
     with _chroma_lock:
         if _chroma_client is None:
             try:
                 import chromadb
                 from athena.core.config import AGENT_DIR
-                
+
                 # Store ChromaDB data in .agent/state/chroma
                 chroma_path = AGENT_DIR / "state" / "chroma"
                 chroma_path.mkdir(parents=True, exist_ok=True)
-                
+
                 _chroma_client = chromadb.PersistentClient(path=str(chroma_path))
                 _chroma_collection = _chroma_client.get_or_create_collection(
                     name="athena_memories",
-                    metadata={"hnsw:space": "cosine"}
+                    metadata=dict(HNSW_METADATA)
                 )
+                _prefetch_chroma_files(chroma_path)
             except ImportError:
                 raise ImportError(
                     "ChromaDB not installed. Install with: pip install chromadb"
@@ -54,6 +210,56 @@ def get_chroma_client():
         return _chroma_client, _chroma_collection
 
 
+# Dimensionality of the warm-up probe (gemini-embedding-001 output size)
+_PROBE_DIM = 3072
+
+
+def preload():
+    """Warm up ChromaDB off the request path.
+
+    First use normally pays a 100-500 ms cold start loading the HNSW
+    graph from disk. Call this from a server's on_startup handler: it
+    constructs the client and issues a throwaway query to force the
+    index pages into memory.
+    """
+    _, collection = get_chroma_client()
+    with contextlib.suppress(Exception):
+        collection.query(query_embeddings=[[0.0] * _PROBE_DIM], n_results=1)
+
+
+def tune_hnsw_for_scale():
+    """Re-tune HNSW search parameters once the collection grows large.
+
+    Larger graphs need wider beams to hold recall; call this
+    periodically from maintenance jobs, not on the query path. Only the
+    search-time knobs are touched: M and construction_ef are baked into
+    the graph at build time, and Chroma rejects modify() calls that
+    include them.
+    """
+    _, collection = get_chroma_client()
+    count = collection.count()
+    if count > 1_000_000:
+        try:
+            collection.modify(metadata={
+                "hnsw:search_ef": 200,
+                "hnsw:num_threads": os.cpu_count() or 4,
+            })
+        except Exception as e:
+            print(f"   ⚠️ HNSW re-tune failed: {e}", file=sys.stderr)
+
+
+def _get_collection(kind: str):
+    """Get or create the per-type collection ``athena_<kind>``."""
+    client, _ = get_chroma_client()
+    with _chroma_lock:
+        if kind not in _collections:
+            _collections[kind] = client.get_or_create_collection(
+                name=f"athena_{kind}",
+                metadata=dict(HNSW_METADATA)
+            )
+        return _collections[kind]
+
+
 def get_embedding_cache():
     global _embedding_cache
     with _embedding_cache_lock:
@@ -63,64 +269,174 @@ def get_embedding_cache():
 
 
 class PersistentEmbeddingCache:
-    """JSON-backed persistent cache with Thread-Safe Atomic Writes."""
+    """SQLite-backed persistent cache (WAL mode, FP16 blobs).
+
+    Each embedding is one row, so an insert writes O(embedding) bytes
+    instead of rewriting the whole cache file. Values are stored as
+    float16 blobs (half the bytes, negligible cosine-similarity loss)
+    and kept in an in-memory dict for lock-free-cheap lookups.
+
+    Writes are coalesced: set() only updates the in-memory dict and a
+    pending map; a single background writer drains the pending map into
+    one transaction after a short debounce window. Bursts of N sets cost
+    one disk transaction instead of N threads and N commits.
+    """
+
+    # Debounce window for coalescing bursts of set() calls into one transaction
+    WRITE_DEBOUNCE_SECONDS = 0.2
 
-    def __init__(self, filename="embedding_cache.json"):
+    def __init__(self, filename="embedding_cache.db"):
         from athena.core.config import AGENT_DIR
         self.cache_file = AGENT_DIR / "state" / filename
-        self.lock = threading.Lock()
-        self._cache: Dict[str, List[float]] = {}
-        self._dirty = False
+        # Readers dominate 99% of traffic; only set()/flush() take the write lock
+        self.rw = _rwlock.RWLockFair() if _rwlock is not None else _SimpleRWLock()
+        self._cache: Dict[str, np.ndarray] = {}
+        self._pending: Dict[str, np.ndarray] = {}
+        self._write_event = threading.Event()
+        self._db_lock = threading.Lock()
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self._db = self._open_db()
         self._load()
-
-    def _load(self):
-        if self.cache_file.exists():
-            try:
-                with self.lock:
-                    self._cache = json.loads(self.cache_file.read_text())
-            except Exception:
-                self._cache = {}
-
-    def _save_worker(self, content: str):
+        self._remove_legacy_json()
+        threading.Thread(target=self._writer_loop, daemon=True).start()
+        atexit.register(self.flush)
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("CREATE TABLE IF NOT EXISTS emb(h TEXT PRIMARY KEY, v BLOB)")
+        return db
+
+    def _open_db(self) -> sqlite3.Connection:
+        """Open the cache database, resetting it if the file is corrupt.
+
+        A broken cache must never take down embedding itself; like the
+        JSON cache this replaced, recover by starting empty.
+        """
         try:
-            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-            fd, temp_path = tempfile.mkstemp(dir=self.cache_file.parent)
+            return self._connect(str(self.cache_file))
+        except sqlite3.Error:
+            with contextlib.suppress(Exception):
+                self.cache_file.unlink(missing_ok=True)
+                for suffix in ("-wal", "-shm"):
+                    self.cache_file.with_name(
+                        self.cache_file.name + suffix
+                    ).unlink(missing_ok=True)
             try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    f.write(content)
-                os.replace(temp_path, self.cache_file)
-            except Exception:
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-        except Exception:
-            pass
+                return self._connect(str(self.cache_file))
+            except sqlite3.Error:
+                # e.g. unwritable directory: degrade to a session-only cache
+                return self._connect(":memory:")
 
-    def _save(self):
+    @staticmethod
+    def _encode(embedding: np.ndarray) -> bytes:
+        return embedding.tobytes()
+
+    @staticmethod
+    def _decode(blob: bytes) -> np.ndarray:
+        return np.frombuffer(blob, dtype=np.float16)
+
+    def _load(self):
         try:
-            with self.lock:
-                if not self._dirty:
-                    return
-                content = json.dumps(self._cache)
-                self._dirty = False
-            threading.Thread(
-                target=self._save_worker, args=(content,), daemon=True
-            ).start()
+            with self.rw.gen_wlock():
+                for h, v in self._db.execute("SELECT h, v FROM emb"):
+                    self._cache[h] = self._decode(v)
         except Exception:
-            pass
+            self._cache = {}
 
-    def get(self, text_hash: str) -> Optional[List[float]]:
-        with self.lock:
+    def _remove_legacy_json(self):
+        """Delete the pre-SQLite JSON cache file, if present.
+
+        Its entries are keyed by md5 and lookups now use blake3/blake2b
+        keys, so importing them would only bloat the database with rows
+        nothing can ever hit.
+        """
+        legacy = self.cache_file.with_name("embedding_cache.json")
+        with contextlib.suppress(Exception):
+            legacy.unlink(missing_ok=True)
+
+    def get(self, text_hash: str) -> Optional[np.ndarray]:
+        with self.rw.gen_rlock():
             return self._cache.get(text_hash)
 
+    def get_many(self, text_hashes: List[str]) -> Dict[str, np.ndarray]:
+        """Look up many hashes under a single read-lock acquisition."""
+        with self.rw.gen_rlock():
+            return {h: self._cache[h] for h in text_hashes if h in self._cache}
+
     def set(self, text_hash: str, embedding: List[float]):
-        with self.lock:
-            self._cache[text_hash] = embedding
-            self._dirty = True
-        self._save()
+        self.set_many({text_hash: embedding})
+
+    def set_many(self, items: Dict[str, List[float]]):
+        """Insert many embeddings with one lock acquisition; disk write is deferred."""
+        if not items:
+            return
+        # fp16 ndarrays: ~15x smaller than List[float] and half the disk bytes
+        items = {h: np.asarray(e, dtype=np.float16) for h, e in items.items()}
+        with self.rw.gen_wlock():
+            self._cache.update(items)
+            self._pending.update(items)
+        self._write_event.set()
+        # Hot LRU may hold stale misses for these keys
+        _hot_get.cache_clear()
+
+    def _writer_loop(self):
+        """Single background writer: waits for pending sets, debounces, flushes."""
+        while True:
+            self._write_event.wait()
+            self._write_event.clear()
+            time.sleep(self.WRITE_DEBOUNCE_SECONDS)
+            self.flush()
+
+    def flush(self):
+        """Write all pending embeddings to disk in one transaction."""
+        with self.rw.gen_wlock():
+            if not self._pending:
+                return
+            pending = self._pending
+            self._pending = {}
+        rows = [(h, self._encode(e)) for h, e in pending.items()]
+        try:
+            with self._db_lock:
+                self._db.execute("BEGIN")
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO emb(h, v) VALUES (?, ?)", rows
+                )
+                self._db.execute("COMMIT")
+        except Exception:
+            with self._db_lock:
+                try:
+                    self._db.execute("ROLLBACK")
+                except Exception:
+                    pass
+            with self.rw.gen_wlock():
+                # Keep unwritten rows pending so a later flush can retry
+                pending.update(self._pending)
+                self._pending = pending
+            self._write_event.set()
+
+
+@functools.lru_cache(maxsize=10000)
+def _hot_get(text_hash: str) -> Optional[np.ndarray]:
+    """In-process LRU in front of the persistent cache.
+
+    Repeated queries (common in agent loops) hit here without touching
+    the reader lock at all. Invalidated wholesale on set_many().
+    """
+    return get_embedding_cache().get(text_hash)
 
 
+@functools.lru_cache(maxsize=4096)
 def _hash_text(text: str) -> str:
-    return hashlib.md5(text.encode()).hexdigest()
+    # Memoized: agent loops re-embed the same prompts constantly, and str
+    # objects carry their own cached hash, so repeat lookups cost ~50 ns.
+    # Cache keys only need collision-resistance, not cryptographic strength.
+    # Both variants keep the 32-hex-char key format md5 produced.
+    data = text.encode("utf-8")
+    if _blake3 is not None:
+        return _blake3.blake3(data).hexdigest(length=16)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
 
 
 def get_embedding(text: str, use_local: bool = False) -> List[float]:
@@ -134,51 +450,205 @@ def get_embedding(text: str, use_local: bool = False) -> List[float]:
     Returns:
         List of floats (embedding vector)
     """
-    text_hash = _hash_text(text)
-    cache = get_embedding_cache()
-    cached = cache.get(text_hash)
-    if cached:
-        return cached
+    return get_embeddings_batch([text], use_local=use_local)[0].astype(np.float32).tolist()
 
-    if use_local:
-        # Local embeddings using sentence-transformers
-        embedding = _get_local_embedding(text)
-    else:
-        # Cloud embeddings using Gemini API
-        embedding = _get_gemini_embedding(text)
 
-    cache.set(text_hash, embedding)
-    return embedding
+def get_embeddings_batch(texts: List[str], use_local: bool = False) -> List[np.ndarray]:
+    """Generate embeddings for many texts with one cache pass and one model/API call.
+
+    Cached texts are served from the persistent cache; only the misses are
+    embedded, in a single batched request (Gemini batchEmbedContents) or a
+    single encode() call (sentence-transformers).
+
+    Args:
+        texts: Texts to embed
+        use_local: If True, use sentence-transformers (local).
+                   If False, use Gemini API (cloud, default)
+
+    Returns:
+        float16 ndarrays in the same order as `texts`
+    """
+    if not texts:
+        return []
+
+    hashes = [_hash_text(t) for t in texts]
+    cache = get_embedding_cache()
+    # Hot LRU first (lock-free on hits), falling through to the persistent cache
+    cached = {}
+    for h in hashes:
+        emb = _hot_get(h)
+        if emb is not None:
+            cached[h] = emb
+
+    miss_indices = [i for i, h in enumerate(hashes) if h not in cached]
+    if miss_indices:
+        # Duplicated content shares a hash: embed each unique text once and
+        # fan the result out to every position that referenced it.
+        unique: Dict[str, str] = {}
+        for i in miss_indices:
+            unique.setdefault(hashes[i], texts[i])
+
+        if use_local:
+            # Local embeddings using sentence-transformers
+            fresh = _get_local_embeddings_batch(list(unique.values()))
+        else:
+            # Cloud embeddings using Gemini API
+            fresh = _get_gemini_embeddings_batch(list(unique.values()))
+
+        by_hash = {
+            h: np.asarray(e, dtype=np.float16) for h, e in zip(unique, fresh)
+        }
+        cache.set_many(by_hash)
+        for i in miss_indices:
+            cached[hashes[i]] = by_hash[hashes[i]]
+
+    return [cached[h] for h in hashes]
 
 
 def _get_local_embedding(text: str) -> List[float]:
     """Generate embedding using sentence-transformers (fully local)."""
+    return _get_local_embeddings_batch([text])[0]
+
+
+def get_st_model():
+    """Get or create the SentenceTransformer model (load weights once per process)."""
+    global _st_model
+
+    with _st_lock:
+        if _st_model is None:
+            try:
+                import torch
+                from sentence_transformers import SentenceTransformer
+
+                device = "cuda" if torch.cuda.is_available() else "cpu"
+                # Use a good all-around model
+                model = SentenceTransformer('all-MiniLM-L6-v2', device=device)
+                model.eval()
+                if device == "cuda":
+                    # FP16 halves memory bandwidth; negligible recall loss for MiniLM
+                    model.half()
+                _st_model = model
+            except ImportError:
+                raise ImportError(
+                    "sentence-transformers not installed. "
+                    "Install with: pip install sentence-transformers"
+                )
+        return _st_model
+
+
+def _get_local_embeddings_batch(texts: List[str]) -> List[List[float]]:
+    """Generate embeddings using sentence-transformers (fully local), one forward pass."""
+    import torch
+
+    model = get_st_model()
+    with torch.inference_mode():
+        embeddings = model.encode(texts, batch_size=64, convert_to_numpy=True)
+    return [e.tolist() for e in embeddings]
+
+
+def _get_gemini_embedding(text: str) -> List[float]:
+    """Generate embedding using Gemini API (cloud)."""
+    api_key = _get_google_api_key()
+
+    url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-embedding-001:embedContent?key={api_key}"
+    payload = {
+        "model": "models/gemini-embedding-001",
+        "content": {"parts": [{"text": text}]},
+    }
+
+    response = _get_session().post(url, json=payload, timeout=20)
+    response.raise_for_status()
+    embedding = response.json()["embedding"]["values"]
+    return embedding
+
+
+def _get_gemini_embeddings_batch(texts: List[str]) -> List[List[float]]:
+    """Generate embeddings for many texts in one Gemini batchEmbedContents call."""
+    api_key = _get_google_api_key()
+
+    url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-embedding-001:batchEmbedContents?key={api_key}"
+    payload = {
+        "requests": [
+            {
+                "model": "models/gemini-embedding-001",
+                "content": {"parts": [{"text": text}]},
+            }
+            for text in texts
+        ]
+    }
+
+    response = _get_session().post(url, json=payload, timeout=60)
+    response.raise_for_status()
+    return [e["values"] for e in response.json()["embeddings"]]
+
+
+# =============================================================================
+# Async Embedding Fetches (httpx)
+# =============================================================================
+
+# httpx.AsyncClient is bound to the event loop it first runs on, so the
+# singleton is recreated whenever callers spin up a fresh loop (asyncio.run).
+_aclient = None
+_aclient_lock = threading.Lock()
+
+# Gemini tolerates ~64 concurrent calls per project; stay well under that
+_ASYNC_MAX_CONCURRENCY = 16
+
+
+def _get_aclient():
+    """Get or create the shared httpx.AsyncClient for the running event loop."""
+    global _aclient
+    import asyncio
+
     try:
-        from sentence_transformers import SentenceTransformer
-        
-        # Use a good all-around model
-        model = SentenceTransformer('all-MiniLM-L6-v2')
-        embedding = model.encode(text, convert_to_numpy=True)
-        return embedding.tolist()
+        import httpx
     except ImportError:
         raise ImportError(
-            "sentence-transformers not installed. "
-            "Install with: pip install sentence-transformers"
+            "httpx not installed. Install with: pip install httpx"
         )
 
+    loop = asyncio.get_running_loop()
+    with _aclient_lock:
+        if (
+            _aclient is None
+            or _aclient.is_closed
+            or getattr(_aclient, "_athena_loop", None) is not loop
+        ):
+            stale = _aclient
+            limits = httpx.Limits(max_connections=32)
+            try:
+                client = httpx.AsyncClient(http2=True, timeout=20, limits=limits)
+            except ImportError:
+                # h2 not installed; HTTP/1.1 keep-alive still pools connections
+                client = httpx.AsyncClient(timeout=20, limits=limits)
+            client._athena_loop = loop
+            _aclient = client
+            if stale is not None and not stale.is_closed:
+                # Best-effort: don't leave the dead loop's connections open
+                # until GC; aclose() on a foreign loop may fail, which is fine
+                with contextlib.suppress(Exception):
+                    loop.create_task(stale.aclose())
+        return _aclient
+
+
+async def aget_embedding(text: str, use_local: bool = False) -> List[float]:
+    """Async variant of get_embedding (cloud fetches overlap their RTTs).
+
+    Local embeddings are offloaded to a worker thread since the model
+    forward pass is synchronous.
+    """
+    import asyncio
 
-def _get_gemini_embedding(text: str) -> List[float]:
-    """Generate embedding using Gemini API (cloud)."""
-    import requests
-    from dotenv import load_dotenv
+    if use_local:
+        return await asyncio.to_thread(get_embedding, text, use_local)
 
-    load_dotenv()
+    text_hash = _hash_text(text)
+    cache = get_embedding_cache()
+    cached = _hot_get(text_hash)
+    if cached is not None:
+        return cached.astype(np.float32).tolist()
 
-    api_key = os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        raise ValueError(
-            "GOOGLE_API_KEY missing. Set it in .env or use use_local=True"
-        )
+    api_key = _get_google_api_key()
 
     url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-embedding-001:embedContent?key={api_key}"
     payload = {
@@ -186,48 +656,161 @@ def _get_gemini_embedding(text: str) -> List[float]:
         "content": {"parts": [{"text": text}]},
     }
 
-    response = requests.post(url, json=payload, timeout=20)
+    response = await _get_aclient().post(url, json=payload)
     response.raise_for_status()
     embedding = response.json()["embedding"]["values"]
+
+    cache.set(text_hash, embedding)
     return embedding
 
 
+async def astore_memories(
+    contents: List[str],
+    metadatas: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ids: Optional[List[str]] = None,
+    use_local_embedding: bool = False,
+    kind: Optional[str] = None
+) -> List[str]:
+    """Async variant of store_memories: concurrent fetches, one upsert.
+
+    Embeddings are fetched with up to _ASYNC_MAX_CONCURRENCY requests in
+    flight, then written to ChromaDB in a single upsert.
+    """
+    import asyncio
+
+    if not contents:
+        return []
+
+    if kind is not None:
+        collection = _get_collection(kind)
+    else:
+        _, collection = get_chroma_client()
+
+    if ids is None:
+        ids = [_hash_text(c) for c in contents]
+
+    semaphore = asyncio.Semaphore(_ASYNC_MAX_CONCURRENCY)
+
+    async def _fetch(text: str) -> List[float]:
+        async with semaphore:
+            return await aget_embedding(text, use_local=use_local_embedding)
+
+    embeddings = await asyncio.gather(*(_fetch(c) for c in contents))
+    metas = [m or {} for m in (metadatas or [None] * len(contents))]
+    keep = _unique_row_indices(ids)
+
+    collection.upsert(
+        ids=[ids[i] for i in keep],
+        embeddings=[embeddings[i] for i in keep],
+        documents=[contents[i] for i in keep],
+        metadatas=[metas[i] for i in keep]
+    )
+
+    return ids
+
+
+def store_memories_parallel(
+    contents: List[str],
+    metadatas: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ids: Optional[List[str]] = None,
+    use_local_embedding: bool = False,
+    kind: Optional[str] = None
+) -> List[str]:
+    """Sync shim over astore_memories for callers without an event loop."""
+    import asyncio
+
+    return asyncio.run(
+        astore_memories(contents, metadatas, ids, use_local_embedding, kind)
+    )
+
+
 # =============================================================================
 # Local Vector Storage (ChromaDB)
 # =============================================================================
 
+def _unique_row_indices(ids: List[str]) -> List[int]:
+    """Indices of the last occurrence of each id, in original order.
+
+    Chroma raises DuplicateIDError when a single upsert repeats an id,
+    and duplicated batch content auto-generates the same hash id. Keep
+    only the final row per id — what sequential upserts would leave.
+    """
+    return sorted({doc_id: i for i, doc_id in enumerate(ids)}.values())
+
+
 def store_memory(
     content: str,
     metadata: Optional[Dict[str, Any]] = None,
     doc_id: Optional[str] = None,
-    use_local_embedding: bool = False
+    use_local_embedding: bool = False,
+    kind: Optional[str] = None
 ) -> str:
     """Store a memory in local ChromaDB.
-    
+
     Args:
         content: The text content to store
         metadata: Optional metadata dict
         doc_id: Optional document ID (auto-generated if not provided)
         use_local_embedding: Use local embeddings instead of Gemini
-    
+        kind: Optional memory type (e.g. "sessions"); routes to the
+              per-type athena_<kind> collection
+
     Returns:
         The document ID
     """
-    _, collection = get_chroma_client()
-    
-    if doc_id is None:
-        doc_id = _hash_text(content)
-    
-    embedding = get_embedding(content, use_local=use_local_embedding)
-    
+    return store_memories(
+        [content],
+        metadatas=[metadata] if metadata is not None else None,
+        ids=[doc_id] if doc_id is not None else None,
+        use_local_embedding=use_local_embedding,
+        kind=kind,
+    )[0]
+
+
+def store_memories(
+    contents: List[str],
+    metadatas: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ids: Optional[List[str]] = None,
+    use_local_embedding: bool = False,
+    kind: Optional[str] = None
+) -> List[str]:
+    """Store many memories in local ChromaDB with one embedding batch and one upsert.
+
+    Args:
+        contents: Text contents to store
+        metadatas: Optional metadata dicts (parallel to contents)
+        ids: Optional document IDs (auto-generated if not provided)
+        use_local_embedding: Use local embeddings instead of Gemini
+        kind: Optional memory type (e.g. "sessions"); routes to the
+              per-type athena_<kind> collection
+
+    Returns:
+        The document IDs, in order
+    """
+    if not contents:
+        return []
+
+    if kind is not None:
+        collection = _get_collection(kind)
+    else:
+        _, collection = get_chroma_client()
+
+    if ids is None:
+        ids = [_hash_text(c) for c in contents]
+
+    embeddings = get_embeddings_batch(contents, use_local=use_local_embedding)
+    metas = [m or {} for m in (metadatas or [None] * len(contents))]
+    keep = _unique_row_indices(ids)
+
     collection.upsert(
-        ids=[doc_id],
-        embeddings=[embedding],
-        documents=[content],
-        metadatas=[metadata or {}]
+        ids=[ids[i] for i in keep],
+        # Chroma boundary: fp16 cache entries back to float32 lists
+        embeddings=[embeddings[i].astype(np.float32).tolist() for i in keep],
+        documents=[contents[i] for i in keep],
+        metadatas=[metas[i] for i in keep]
     )
-    
-    return doc_id
+
+    return ids
 
 
 def search_memories(
@@ -262,23 +845,28 @@ def search_memories(
         include=["documents", "metadatas", "distances"]
     )
     
-    # Format results
-    formatted = []
-    if results and results["ids"] and results["ids"][0]:
-        for i, doc_id in enumerate(results["ids"][0]):
-            distance = results["distances"][0][i] if results["distances"] else 0
-            similarity = 1 - distance
-            
-            if similarity >= threshold:
-                formatted.append({
-                    "id": doc_id,
-                    "content": results["documents"][0][i] if results["documents"] else "",
-                    "metadata": results["metadatas"][0][i] if results["metadatas"] else {},
-                    "similarity": similarity,
-                    "distance": distance
-                })
-    
-    return formatted
+    # Format results: filter on similarity in numpy, allocate dicts only
+    # for the kept rows. (distances is always a list-of-lists when queried.)
+    if not (results and results["ids"] and results["ids"][0]):
+        return []
+
+    ids = results["ids"][0]
+    docs = results["documents"][0]
+    metas = results["metadatas"][0]
+    distances = np.asarray(results["distances"][0], dtype=np.float32)
+    similarities = 1.0 - distances
+    keep = np.nonzero(similarities >= threshold)[0]
+
+    return [
+        {
+            "id": ids[i],
+            "content": docs[i],
+            "metadata": metas[i],
+            "similarity": float(similarities[i]),
+            "distance": float(distances[i]),
+        }
+        for i in keep
+    ]
 
 
 def delete_memory(doc_id: str) -> bool:
@@ -295,12 +883,21 @@ def count_memories() -> int:
 
 
 def clear_all_memories() -> bool:
-    """Clear all memories from local storage."""
-    _, collection = get_chroma_client()
-    # Delete all by getting all IDs first
-    all_docs = collection.get()
-    if all_docs and all_docs["ids"]:
-        collection.delete(ids=all_docs["ids"])
+    """Clear all memories from local storage (default and per-type collections)."""
+    global _chroma_collection
+    client, _ = get_chroma_client()
+    # Drop and recreate the collection: O(1) instead of round-tripping every
+    # document (collection.get() returns embeddings too) just to delete by id.
+    with _chroma_lock:
+        for kind in SEARCH_COLLECTIONS:
+            with contextlib.suppress(Exception):
+                client.delete_collection(f"athena_{kind}")
+        _collections.clear()
+        client.delete_collection("athena_memories")
+        _chroma_collection = client.create_collection(
+            name="athena_memories",
+            metadata=dict(HNSW_METADATA)
+        )
     return True
 
 
@@ -315,70 +912,84 @@ def get_client() -> Any:
 
 
 def search_rpc(
-    rpc_name: str, 
-    query_embedding: List[float], 
-    limit: int = 5, 
+    rpc_name: str,
+    query_embedding: List[float],
+    limit: int = 5,
     threshold: float = 0.3
 ) -> List[Dict]:
-    """Compatibility: Search using ChromaDB instead of Supabase RPC."""
-    _, collection = get_chroma_client()
-    
+    """Compatibility: Search using ChromaDB instead of Supabase RPC.
+
+    Routes to the per-type collection derived from rpc_name (e.g.
+    search_sessions -> athena_sessions). Unknown names — and per-type
+    collections that are still empty, i.e. everything stored before the
+    partitioning or without kind= — fall back to the monolithic
+    athena_memories collection.
+    """
+    kind = rpc_name.removeprefix("search_")
+    collection = None
+    if kind in SEARCH_COLLECTIONS:
+        collection = _get_collection(kind)
+        if collection.count() == 0:
+            collection = None
+    if collection is None:
+        _, collection = get_chroma_client()
+
     results = collection.query(
         query_embeddings=[query_embedding],
         n_results=limit,
         include=["documents", "metadatas", "distances"]
     )
     
-    formatted = []
-    if results and results["ids"] and results["ids"][0]:
-        for i, doc_id in enumerate(results["ids"][0]):
-            distance = results["distances"][0][i] if results["distances"] else 0
-            similarity = 1 - distance
-            
-            if similarity >= threshold:
-                formatted.append({
-                    "id": doc_id,
-                    "content": results["documents"][0][i] if results["documents"] else "",
-                    "metadata": results["metadatas"][0][i] if results["metadatas"] else {},
-                    "similarity": similarity
-                })
-    
-    return formatted
-
-
-# Collection-specific wrappers (compatibility with vectors.py)
-def search_sessions(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_sessions", query_embedding, limit, threshold)
-
-def search_case_studies(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_case_studies", query_embedding, limit, threshold)
-
-def search_protocols(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_protocols", query_embedding, limit, threshold)
-
-def search_capabilities(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_capabilities", query_embedding, limit, threshold)
-
-def search_playbooks(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_playbooks", query_embedding, limit, threshold)
-
-def search_references(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_references", query_embedding, limit, threshold)
-
-def search_frameworks(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_frameworks", query_embedding, limit, threshold)
-
-def search_workflows(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_workflows", query_embedding, limit, threshold)
-
-def search_entities(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_entities", query_embedding, limit, threshold)
-
-def search_user_profile(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_user_profile", query_embedding, limit, threshold)
-
-def search_system_docs(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_system_docs", query_embedding, limit, threshold)
-
-def search_insights(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_insights", query_embedding, limit, threshold)
\ No newline at end of file
+    # Same vectorized post-filter as search_memories
+    if not (results and results["ids"] and results["ids"][0]):
+        return []
+
+    ids = results["ids"][0]
+    docs = results["documents"][0]
+    metas = results["metadatas"][0]
+    distances = np.asarray(results["distances"][0], dtype=np.float32)
+    similarities = 1.0 - distances
+    keep = np.nonzero(similarities >= threshold)[0]
+
+    return [
+        {
+            "id": ids[i],
+            "content": docs[i],
+            "metadata": metas[i],
+            "similarity": float(similarities[i]),
+        }
+        for i in keep
+    ]
+
+
+# Collection-specific wrappers (compatibility with vectors.py).
+# Identical modulo the RPC name, so they are generated from one factory.
+SEARCH_COLLECTIONS = (
+    "sessions",
+    "case_studies",
+    "protocols",
+    "capabilities",
+    "playbooks",
+    "references",
+    "frameworks",
+    "workflows",
+    "entities",
+    "user_profile",
+    "system_docs",
+    "insights",
+)
+
+
+def _make_search_wrapper(rpc_name: str):
+    def _search(client, query_embedding, limit=5, threshold=0.3):
+        return search_rpc(rpc_name, query_embedding, limit, threshold)
+
+    _search.__name__ = rpc_name
+    _search.__qualname__ = rpc_name
+    _search.__doc__ = f"Search the {rpc_name[len('search_'):]} collection."
+    return _search
+
+
+for _collection in SEARCH_COLLECTIONS:
+    globals()[f"search_{_collection}"] = _make_search_wrapper(f"search_{_collection}")
+del _collection
\ No newline at end of file
@@ -8,12 +8,7 @@ Optimizations:
 """
 
 import os
-import sys
-import hashlib
-import json
 import threading
-import tempfile
-from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 # Check for local mode
@@ -27,23 +22,17 @@ if LOCAL_MODE:
         get_client as _local_get_client,
         search_rpc as _local_search_rpc,
         store_memory,
+        store_memories,
         search_memories,
         count_memories,
         clear_all_memories,
     )
 
-# Global cache instance
-_embedding_cache = None
-_embedding_cache_lock = threading.Lock()
-
-
-def get_embedding_cache():
-    global _embedding_cache
-    with _embedding_cache_lock:
-        if _embedding_cache is None:
-            _embedding_cache = PersistentEmbeddingCache()
-        return _embedding_cache
-
+# Embedding cache is shared with local mode (single implementation, single file)
+from athena.memory.local_vectors import (  # noqa: E402
+    PersistentEmbeddingCache,
+    get_embedding_cache,
+)
 
 # Thread-local storage for Supabase clients
 _thread_local = threading.local()
@@ -69,72 +58,10 @@ def get_client() -> Any:
     return _thread_local.client
 
 
-class PersistentEmbeddingCache:
-    """JSON-backed persistent cache with Thread-Safe Atomic Writes and Background Saving."""
-
-    def __init__(self, filename="embedding_cache.json"):
-        # Correct pathing via project discovery
-        from athena.core.config import AGENT_DIR
-
-        self.cache_file = AGENT_DIR / "state" / filename
-        self.lock = threading.Lock()
-        self._cache: Dict[str, List[float]] = {}
-        self._dirty = False
-        self._load()
-
-    def _load(self):
-        if self.cache_file.exists():
-            try:
-                with self.lock:
-                    self._cache = json.loads(self.cache_file.read_text())
-            except Exception:
-                self._cache = {}
-
-    def _save_worker(self, content: str):
-        """Worker thread for atomic disk operations."""
-        try:
-            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-            # Atomic swap pattern
-            fd, temp_path = tempfile.mkstemp(dir=self.cache_file.parent)
-            try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    f.write(content)
-                os.replace(temp_path, self.cache_file)
-            except Exception:
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-        except Exception:
-            pass
-
-    def _save(self):
-        """Schedules a background atomic save."""
-        try:
-            with self.lock:
-                if not self._dirty:
-                    return
-                content = json.dumps(self._cache)
-                self._dirty = False
-
-            # Offload IO to a daemon thread to avoid blocking caller
-            threading.Thread(
-                target=self._save_worker, args=(content,), daemon=True
-            ).start()
-        except Exception:
-            pass
-
-    def get(self, text_hash: str) -> Optional[List[float]]:
-        with self.lock:
-            return self._cache.get(text_hash)
-
-    def set(self, text_hash: str, embedding: List[float]):
-        with self.lock:
-            self._cache[text_hash] = embedding
-            self._dirty = True
-        self._save()
-
-
 def _hash_text(text: str) -> str:
-    return hashlib.md5(text.encode()).hexdigest()
+    # Shared with local mode so both backends produce identical cache keys.
+    from athena.memory.local_vectors import _hash_text as _hash
+    return _hash(text)
 
 
 def get_embedding(text: str) -> List[float]:
@@ -150,18 +77,14 @@ def get_embedding(text: str) -> List[float]:
     text_hash = _hash_text(text)
     cache = get_embedding_cache()
     cached = cache.get(text_hash)
-    if cached:
-        return cached
-
-    # Fetch remote (Gemini) - Lazy load requests
-    import requests
-    from dotenv import load_dotenv
+    if cached is not None:
+        # Cache stores fp16 ndarrays; callers expect float lists
+        return cached.astype("float32").tolist()
 
-    load_dotenv()
+    # Fetch remote (Gemini) - pooled session and cached key shared with local mode
+    from athena.memory.local_vectors import _get_google_api_key, _get_session
 
-    api_key = os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        raise ValueError("GOOGLE_API_KEY missing.")
+    api_key = _get_google_api_key()
 
     url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-embedding-001:embedContent?key={api_key}"
     payload = {
@@ -169,7 +92,7 @@ def get_embedding(text: str) -> List[float]:
         "content": {"parts": [{"text": text}]},
     }
 
-    response = requests.post(url, json=payload, timeout=20)
+    response = _get_session().post(url, json=payload, timeout=20)
     response.raise_for_status()
     embedding = response.json()["embedding"]["values"]
 
@@ -202,52 +125,22 @@ def search_rpc(
 
 
 # --- Collection-Specific Wrappers ---
+# Identical modulo the RPC name, so they are generated from one factory
+# over the same collection list local mode uses.
 
+from athena.memory.local_vectors import SEARCH_COLLECTIONS  # noqa: E402
 
-def search_sessions(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_sessions", query_embedding, limit, threshold)
-
-
-def search_case_studies(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_case_studies", query_embedding, limit, threshold)
-
-
-def search_protocols(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_protocols", query_embedding, limit, threshold)
-
-
-def search_capabilities(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_capabilities", query_embedding, limit, threshold)
-
-
-def search_playbooks(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_playbooks", query_embedding, limit, threshold)
-
-
-def search_references(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_references", query_embedding, limit, threshold)
-
-
-def search_frameworks(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_frameworks", query_embedding, limit, threshold)
-
-
-def search_workflows(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_workflows", query_embedding, limit, threshold)
-
-
-def search_entities(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_entities", query_embedding, limit, threshold)
-
-
-def search_user_profile(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_user_profile", query_embedding, limit, threshold)
 
+def _make_search_wrapper(rpc_name: str):
+    def _search(client, query_embedding, limit=5, threshold=0.3):
+        return search_rpc(rpc_name, query_embedding, limit, threshold)
 
-def search_system_docs(client, query_embedding, limit=5, threshold=0.3):
-    return search_rpc("search_system_docs", query_embedding, limit, threshold)
+    _search.__name__ = rpc_name
+    _search.__qualname__ = rpc_name
+    _search.__doc__ = f"Search the {rpc_name[len('search_'):]} collection."
+    return _search
 
 
-def search_insights(client, query_embedding, limit=5, threshold=0.3):
-    """Search insights table (Marketing Analysis, Strategic Notes)."""
-    return search_rpc("search_insights", query_embedding, limit, threshold)
+for _collection in SEARCH_COLLECTIONS:
+    globals()[f"search_{_collection}"] = _make_search_wrapper(f"search_{_collection}")
+del _collection